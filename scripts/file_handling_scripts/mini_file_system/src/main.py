@@ -1,10 +1,12 @@
 import os
+import queue
 import logging
 import argparse
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from src.utils.path_manager import PathManager
-from src.utils.file_scanner import FileScanner
+from src.utils.file_scanner import FileScanner, format_mtime
 from src.utils.config_loader import load_config
 from src.utils.report_writer import ReportWriter
 
@@ -13,24 +15,41 @@ from src.utils.report_writer import ReportWriter
 # .parent         =  mini_file_system/src/
 # .parent         =  mini_file_system/            ← project root ✓
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH  = PROJECT_ROOT / "config" / "config.json"
+LOG_DIR      = PROJECT_ROOT / "logs"
+REPORTS_DIR  = PROJECT_ROOT / "reports"
 
 
-def setup_logging(level_str: str) -> None:
+def setup_logging(level_str: str) -> QueueListener:
     """Configure root logger with file + console handlers.
     Log file goes to mini_file_system/logs/app.log (project root).
+
+    Logging calls only put the record on a queue; a background
+    QueueListener thread does the actual file/console writes, so the scan
+    loop never waits on log I/O. Call .stop() on the returned listener
+    before exiting to flush pending records.
     """
-    log_dir = PROJECT_ROOT / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    formatter = logging.Formatter("%(asctime)s — %(levelname)s — %(message)s")
+    # delay=True: the file is opened on the first record, not here
+    file_handler = logging.FileHandler(LOG_DIR / "app.log", encoding="utf-8", delay=True)
+    console_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    # The queue side must only merge args into the message — the real
+    # formatting happens once, in the listener's handlers.
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
 
     level = getattr(logging, level_str.upper(), logging.DEBUG)
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s — %(levelname)s — %(message)s",
-        handlers=[
-            logging.FileHandler(log_dir / "app.log", encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
-    )
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+    listener = QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    return listener
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,13 +64,23 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
 
     # ── Load config from mini_file_system/config/config.json ────────
-    config = load_config(str(PROJECT_ROOT / "config" / "config.json"))
+    config = load_config(str(CONFIG_PATH))
 
     # ── Setup logging before any logging calls ───────────────────────
-    setup_logging(config["log_level"])
+    # The listener thread must be stopped on every exit path, or records
+    # still in the queue are lost.
+    listener = setup_logging(config["log_level"])
+    try:
+        _run(config)
+    finally:
+        listener.stop()
+
+
+def _run(config: dict) -> None:
+    """Everything main() does once logging is up."""
 
-    logging.debug(f"Project root : {PROJECT_ROOT}")
-    logging.debug(f"CWD          : {os.getcwd()}")
+    logging.debug("Project root : %s", PROJECT_ROOT)
+    logging.debug("CWD          : %s", os.getcwd())
 
     # ── CLI overrides ────────────────────────────────────────────────
     args = parse_args()
@@ -61,27 +90,28 @@ def main() -> None:
     # ── Resolve target folder relative to project root ───────────────
     # "data"  ->  mini_file_system/data/   (never src/data)
     target_folder = PathManager.resolve_path(PROJECT_ROOT, target_folder_name)
-    logging.debug(f"Target folder: {target_folder}")
+    logging.debug("Target folder: %s", target_folder)
 
     PathManager.ensure_exists(target_folder, expected_type="dir", create_if_missing=True)
 
     # ── Scan ─────────────────────────────────────────────────────────
     scanner = FileScanner(target_folder, threshold_mb)
 
+    # Checked once: skips the per-file dict → str conversion when INFO is off
+    log_meta = logging.getLogger().isEnabledFor(logging.INFO)
     for meta in scanner.scan():
-        if meta is not None:   # None = file failed extraction (already logged)
-            logging.info(meta)
+        if meta is not None and log_meta:   # None = file failed extraction (already logged)
+            # mtime is stored raw; only format it for files we actually log
+            logging.info({**meta, "modified": format_mtime(meta["modified"])})
 
     scanner.report_duplicates()
     scanner.report_summary()
 
     # ── Write report to mini_file_system/reports/ ────────────────────
-    scan_summary = scanner.get_summary()
-    reports_dir  = str(PROJECT_ROOT / "reports")
-    writer        = ReportWriter(reports_dir)
-    out_path      = writer.write_report(scan_summary, filename=args.report)
+    writer   = ReportWriter(str(REPORTS_DIR))
+    out_path = writer.write_report(scanner, filename=args.report)
 
-    logging.info(f"Report saved : {out_path}")
+    logging.info("Report saved : %s", out_path)
 
 
 if __name__ == "__main__":
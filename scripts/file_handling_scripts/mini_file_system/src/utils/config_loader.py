@@ -4,6 +4,26 @@ from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict
 
+# Optional: orjson parses/serialises much faster than the stdlib and works on
+# bytes directly. Its JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 # Immutable reference — never mutate this directly.
 # Use _get_default_config() to get a safe working copy.
 _DEFAULT_CONFIG: Dict[str, Any] = {
@@ -42,12 +62,12 @@ def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
 
     if not cfg_path.exists():
         default = _get_default_config()
-        cfg_path.write_text(json.dumps(default, indent=2), encoding="utf-8")
-        logging.info(f"Config not found — created default at: {cfg_path}")
+        cfg_path.write_bytes(_dumps(default))
+        logging.info("Config not found — created default at: %s", cfg_path)
         config = default
     else:
         try:
-            config = json.loads(cfg_path.read_text(encoding="utf-8"))
+            config = _loads(cfg_path.read_bytes())
         except json.JSONDecodeError as e:
             raise ValueError(f"Config file is not valid JSON: {cfg_path}") from e
 
@@ -72,7 +92,7 @@ def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
     config["log_level"] = config["log_level"].strip().upper()
     if config["log_level"] not in _VALID_LOG_LEVELS:
         logging.warning(
-            f"Unsupported log_level '{config['log_level']}'. Falling back to 'INFO'."
+            "Unsupported log_level '%s'. Falling back to 'INFO'.", config["log_level"]
         )
         config["log_level"] = "INFO"
 
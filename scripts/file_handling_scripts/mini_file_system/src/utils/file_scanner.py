@@ -1,8 +1,54 @@
 import os
+import re
+import hashlib
 import logging
-from collections import defaultdict
-from typing import Dict, Generator, Optional
-from datetime import datetime
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Dict, Generator, Hashable, Optional, Set, Tuple, Union
+
+# Optional: BLAKE3 is SIMD/multi-thread accelerated and much faster than
+# hashlib. Without it, fall back to blake2b from the standard library.
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+
+# Duplicate detection: bytes read for the cheap "short hash" tier, and the
+# chunk size used when streaming whole files through the full hash.
+_SHORT_HASH_BYTES = 64 * 1024
+_FULL_HASH_CHUNK = 4 * 1024 * 1024
+
+# Files per thread-pool task. A stat costs about a microsecond, while
+# submitting and collecting a future costs several, so a task per file
+# would spend most of the scan on pool overhead.
+_BATCH_SIZE = 256
+
+# One read buffer shared by every full hash instead of a fresh 4 MiB
+# allocation per file. The lock only matters if several scanners hash at once.
+_HASH_BUF = bytearray(_FULL_HASH_CHUNK)
+_HASH_MV = memoryview(_HASH_BUF)
+_HASH_BUF_LOCK = threading.Lock()
+
+
+# Simulated-failure hook: one C-level case-insensitive search per name
+# instead of lower() + substring scan.
+_FAIL_RE = re.compile("fail", re.IGNORECASE).search
+
+_root_logger = logging.getLogger()
+
+
+def format_mtime(mtime: float) -> str:
+    """Format an epoch mtime from the scan metadata as local time."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))
 
 
 class FileScanner:
@@ -10,14 +56,26 @@ class FileScanner:
     Walks a directory tree, extracts file metadata, and tracks scan statistics.
 
     Counters:
-        total_discovered : every file os.walk sees
+        total_discovered : every file the directory walk sees
         total_processed  : files successfully extracted
         total_failed     : files that raised an exception during extraction
+
+    Counters are only touched by the thread iterating scan(); the metrics
+    below are filled in by worker threads and guarded by self._lock.
     """
 
-    def __init__(self, root_path: str, large_file_threshold_mb: int = 10) -> None:
+    def __init__(
+        self,
+        root_path: str,
+        large_file_threshold_mb: int = 10,
+        max_workers: Optional[int] = None,
+    ) -> None:
         self.root_path = root_path
+        self.large_file_threshold_mb = large_file_threshold_mb
         self.large_file_threshold_bytes = large_file_threshold_mb * 1024 * 1024
+        # stat/open release the GIL, so oversubscribing the CPUs pays off
+        self.max_workers = max_workers or (os.cpu_count() or 1) * 4
+        self._lock = threading.Lock()
 
         # Counters
         self.total_discovered: int = 0
@@ -25,9 +83,18 @@ class FileScanner:
         self.total_failed: int = 0
 
         # Metrics
-        self.extension_count: Dict[str, int] = defaultdict(int)
+        self.extension_count: Counter[str] = Counter()
         self.large_files: list[str] = []
-        self.duplicates: Dict[str, list[str]] = defaultdict(list)
+        self.duplicates: Dict[bytes, list[str]] = {}
+
+        # Raw per-file extensions, folded into extension_count after the walk
+        self._ext_list: list[str] = []
+
+        # Candidate duplicates grouped by size (filled during the walk).
+        # A size only gets a bucket on its second sighting; until then its
+        # single path lives in _first_seen, so _by_size never holds singletons.
+        self._first_seen: Dict[int, str] = {}
+        self._by_size: Dict[int, list[str]] = {}
 
     # ------------------------------------------------------------------
     # MAIN SCAN LOOP
@@ -37,64 +104,278 @@ class FileScanner:
         Yield metadata dicts for each successfully processed file.
         Failed files yield None so callers can count/log them if needed.
         After the walk completes, counter integrity is verified.
+
+        Files are discovered on the calling thread and handed to a thread
+        pool in batches of _BATCH_SIZE, so results arrive in batch
+        completion order. At most max_workers * 2 batches are in flight.
         """
-        for root, _, files in os.walk(self.root_path):
-            for filename in files:
-                full_path = os.path.join(root, filename)
-                self.total_discovered += 1
+        window = self.max_workers * 2
+        pending: Set[Future] = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch in self._iter_batches():
+                self.total_discovered += len(batch)
+                pending.add(executor.submit(self._extract_batch, batch))
 
-                try:
-                    meta = self._extract_metadata(full_path)
-                    self.total_processed += 1
-                    yield meta
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from self._collect(future.result())
 
-                except Exception as e:
-                    self.total_failed += 1
-                    logging.error(f"[FAILED] {full_path} → {e}")
-                    yield None  # explicit None so callers know a file was skipped
+            for future in as_completed(pending):
+                yield from self._collect(future.result())
 
+        # One C-level Counter.update instead of a dict increment per file
+        self.extension_count.update(self._ext_list)
+        self._ext_list.clear()
+
+        # Workers finish in arbitrary order; sort so reports are diffable
+        self.large_files.sort()
+        self._find_duplicates()
         self._verify_counters()
 
+    def _iter_files(self) -> Generator[os.DirEntry, None, None]:
+        """Yield a DirEntry for every file below root_path."""
+        # Explicit scandir stack instead of os.walk: the file type comes from
+        # the directory read itself (d_type), so telling files and dirs
+        # apart needs no extra stat() per entry.
+        stack = [self.root_path]
+        while stack:
+            directory = stack.pop()
+            try:
+                it = os.scandir(directory)
+            except OSError as e:
+                # os.walk silently skipped unreadable directories; log instead
+                logging.error("[SKIPPED DIR] %s → %s", directory, e)
+                continue
+
+            with it:
+                while True:
+                    try:
+                        entry = next(it)
+                    except StopIteration:
+                        break
+                    except OSError as e:
+                        # Failed partway through the directory — keep what
+                        # was already yielded, skip the rest (as os.walk does)
+                        logging.error("[SKIPPED DIR] %s → %s", directory, e)
+                        break
+
+                    # Same rules as os.walk: symlinked dirs are neither
+                    # descended into nor counted as files. With DT_UNKNOWN
+                    # these calls fall back to a stat(), which can fail —
+                    # an entry that can't be checked is treated as a file.
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        try:
+                            is_symlink = entry.is_symlink()
+                        except OSError:
+                            is_symlink = False
+                        if not is_symlink:
+                            stack.append(entry.path)
+                        continue
+                    yield entry
+
+    def _iter_batches(self) -> Generator[list[os.DirEntry], None, None]:
+        """Group _iter_files() into lists of up to _BATCH_SIZE entries."""
+        batch: list[os.DirEntry] = []
+        for entry in self._iter_files():
+            batch.append(entry)
+            if len(batch) == _BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _collect(
+        self, results: list[Tuple[str, Union[Dict, Exception]]]
+    ) -> Generator[Optional[Dict], None, None]:
+        """Turn a finished batch into scan results and update counters."""
+        for path, meta in results:
+            if isinstance(meta, Exception):
+                self.total_failed += 1
+                logging.error("[FAILED] %s → %s", path, meta)
+                yield None  # explicit None so callers know a file was skipped
+            else:
+                self.total_processed += 1
+                yield meta
+
     # ------------------------------------------------------------------
     # METADATA EXTRACTION
     # ------------------------------------------------------------------
-    def _extract_metadata(self, path: str) -> Dict:
+    def _extract_batch(
+        self, entries: list[os.DirEntry]
+    ) -> list[Tuple[str, Union[Dict, Exception]]]:
         """
-        Extract metadata from a single file.
-        Raises RuntimeError for simulated failures (filename contains 'fail').
+        Extract metadata for a batch of files (called on a worker thread).
+
+        Returns (path, meta) pairs in input order, with the exception in
+        place of meta for files that failed. Shared metrics are merged
+        under self._lock once per batch rather than once per file.
         """
-        if "fail" in os.path.basename(path).lower():
-            raise RuntimeError("Simulated failure — filename contains 'fail'")
+        results: list[Tuple[str, Union[Dict, Exception]]] = []
+        exts: list[str] = []
+        large: list[str] = []
+        candidates: list[Tuple[int, str]] = []
+
+        for entry in entries:
+            try:
+                meta = self._extract_metadata(entry)
+                # Answered from the lstat() above — no extra syscall
+                is_symlink = entry.is_symlink()
+            except Exception as e:
+                results.append((entry.path, e))
+                continue
+
+            results.append((entry.path, meta))
+            exts.append(meta["extension"])
+            size = meta["size"]
+            if size > self.large_file_threshold_bytes:
+                large.append(entry.path)
+            # Duplicate candidates — empty files are already flagged.
+            # Symlinks are skipped: their size is the link's own length, but
+            # hashing would open (and follow) them.
+            if size and not is_symlink:
+                candidates.append((size, entry.path))
 
-        size = os.path.getsize(path)
-        ext = os.path.splitext(path)[1] or "<no-ext>"
-        modified = datetime.fromtimestamp(os.path.getmtime(path)).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        with self._lock:
+            self._ext_list.extend(exts)
+            self.large_files.extend(large)
+            first_seen = self._first_seen
+            for size, path in candidates:
+                prev = first_seen.get(size)
+                if prev is None:
+                    first_seen[size] = path
+                else:
+                    self._by_size.setdefault(size, [prev]).append(path)
+
+        return results
+
+    def _extract_metadata(self, entry: os.DirEntry) -> Dict:
+        """
+        Extract metadata from a single file.
+        Raises RuntimeError for simulated failures (filename contains 'fail')
+        unless Python runs with -O.
+        """
+        # DirEntry already holds the basename — no need to re-parse the path
+        path = entry.path
+        name = entry.name
+        # Debug-only failure hook; stripped entirely under `python -O`
+        if __debug__:
+            if _FAIL_RE(name):
+                raise RuntimeError("Simulated failure — filename contains 'fail'")
 
-        # Extension tracking
-        self.extension_count[ext] += 1
+        st = entry.stat(follow_symlinks=False)
+        size = st.st_size
+        ext = os.path.splitext(name)[1] or "<no-ext>"
 
         # Size warnings
         if size == 0:
-            logging.warning(f"Zero-byte file detected: {path}")
+            logging.warning("Zero-byte file detected: %s", path)
         elif size > self.large_file_threshold_bytes:
-            threshold_mb = self.large_file_threshold_bytes // (1024 * 1024)
-            logging.warning(
-                f"Large file (>{threshold_mb} MB): {path} ({size} bytes)"
-            )
-            self.large_files.append(path)
-
-        # Duplicate name tracking
-        self.duplicates[os.path.basename(path)].append(path)
+            if _root_logger.isEnabledFor(logging.WARNING):
+                logging.warning(
+                    "Large file (>%d MB): %s (%d bytes)",
+                    self.large_file_threshold_mb, path, size,
+                )
 
         return {
             "path": path,
             "size": size,
             "extension": ext,
-            "modified": modified,
+            "modified": st.st_mtime,   # raw epoch float — see format_mtime()
         }
 
+    # ------------------------------------------------------------------
+    # DUPLICATE DETECTION
+    # ------------------------------------------------------------------
+    def _find_duplicates(self) -> None:
+        """
+        Group files with identical content into self.duplicates.
+
+        Buckets and paths are visited in sorted order, so groups and the
+        paths inside them come out the same on every run.
+
+        Three tiers, each only looking at survivors of the previous one:
+            1. same size            (free — only shared sizes are kept)
+            2. same short hash      (first 64 KiB)
+            3. same full hash       (whole file, streamed in 4 MiB chunks)
+        """
+        self.duplicates = {}
+
+        for _, paths in sorted(self._by_size.items()):
+            paths.sort()
+            by_head = self._group_by_hash(paths, self._short_hash)
+            for (head_digest, complete), head_paths in by_head.items():
+                if len(head_paths) < 2:
+                    continue
+
+                # The head read hit EOF, so the head hash covers the whole
+                # file. Decided from the read, not the scanned size, in case
+                # the file grew since it was stat'ed.
+                if complete:
+                    self.duplicates[head_digest] = head_paths
+                    continue
+
+                by_full = self._group_by_hash(head_paths, self._full_hash)
+
+                for digest, full_paths in by_full.items():
+                    if len(full_paths) > 1:
+                        self.duplicates[digest] = full_paths
+
+    @staticmethod
+    def _group_by_hash(paths: list[str], hash_fn) -> Dict[Hashable, list[str]]:
+        """Bucket paths by hash_fn(path), dropping files that can't be read."""
+        groups: Dict[Hashable, list[str]] = defaultdict(list)
+        for path in paths:
+            try:
+                groups[hash_fn(path)].append(path)
+            except OSError as e:
+                logging.error("[HASH FAILED] %s → %s", path, e)
+        return groups
+
+    @staticmethod
+    def _new_hasher(data: bytes = b""):
+        """Return a BLAKE3 hasher if available, else a 32-byte blake2b."""
+        if _blake3 is not None:
+            return _blake3(data)
+        return hashlib.blake2b(data, digest_size=32)
+
+    @staticmethod
+    def _short_hash(path: str) -> Tuple[bytes, bool]:
+        """
+        Hash the head of a file.
+
+        Returns (digest, complete) where complete is True when the read
+        reached EOF, i.e. the digest covers the entire file.
+        """
+        # One read of the head — no point going through a BufferedReader.
+        # The extra byte tells us whether anything follows the head.
+        with open(path, "rb", buffering=0) as f:
+            head = f.read(_SHORT_HASH_BYTES + 1)
+        complete = len(head) <= _SHORT_HASH_BYTES
+        return FileScanner._new_hasher(head).digest(), complete
+
+    @staticmethod
+    def _full_hash(path: str) -> bytes:
+        if _blake3 is not None:
+            # Memory-maps the file and hashes it on all cores
+            h = _blake3(max_threads=_blake3.AUTO)
+            h.update_mmap(path)
+            return h.digest()
+
+        h = FileScanner._new_hasher()
+        # Unbuffered: readinto() fills the shared buffer straight from the
+        # file, so a BufferedReader would only add a copy.
+        with _HASH_BUF_LOCK, open(path, "rb", buffering=0) as f:
+            while n := f.readinto(_HASH_BUF):
+                h.update(_HASH_MV[:n])
+        return h.digest()
+
     # ------------------------------------------------------------------
     # COUNTER INTEGRITY CHECK
     # ------------------------------------------------------------------
@@ -106,33 +387,18 @@ class FileScanner:
                 f"processed={self.total_processed}, failed={self.total_failed}"
             )
 
-    # ------------------------------------------------------------------
-    # SUMMARY
-    # ------------------------------------------------------------------
-    def get_summary(self) -> Dict:
-        """Return a serialisable summary dict. Verifies counters first."""
-        self._verify_counters()
-        return {
-            "total_discovered": self.total_discovered,
-            "total_processed": self.total_processed,
-            "total_failed": self.total_failed,
-            "extension_count": dict(self.extension_count),
-            "large_files": list(self.large_files),
-            "duplicates": dict(self.duplicates),
-        }
-
     # ------------------------------------------------------------------
     # LOGGING HELPERS
     # ------------------------------------------------------------------
     def report_summary(self) -> None:
-        logging.info(f"Discovered : {self.total_discovered}")
-        logging.info(f"Processed  : {self.total_processed}")
-        logging.info(f"Failed     : {self.total_failed}")
+        logging.info("Discovered : %d", self.total_discovered)
+        logging.info("Processed  : %d", self.total_processed)
+        logging.info("Failed     : %d", self.total_failed)
         for ext, count in self.extension_count.items():
-            logging.info(f"  {ext} → {count} file(s)")
-        logging.info(f"Large files: {len(self.large_files)}")
+            logging.info("  %s → %d file(s)", ext, count)
+        logging.info("Large files: %d", len(self.large_files))
 
     def report_duplicates(self) -> None:
-        for name, paths in self.duplicates.items():
-            if len(paths) > 1:
-                logging.info(f"Duplicate → {name}: {paths}")
\ No newline at end of file
+        # self.duplicates only ever holds groups of two or more
+        for digest, paths in self.duplicates.items():
+            logging.info("Duplicate → %s: %s", digest.hex()[:16], paths)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -6,8 +7,13 @@ class PathManager:
 
     @staticmethod
     def resolve_path(base_path: str | Path, relative_path: str) -> str:
-        """Resolve a relative path against a base path and return absolute string."""
-        return str((Path(base_path) / relative_path).resolve())
+        """
+        Resolve a relative path against a base path and return absolute string.
+
+        Purely lexical (normalises '..' and '.'); symlinks are not resolved,
+        so no file system calls are made.
+        """
+        return os.path.abspath(os.path.join(base_path, relative_path))
 
     @staticmethod
     def ensure_exists(
@@ -1,75 +1,93 @@
 import os
-from typing import Any, Dict
+
+from src.utils.file_scanner import FileScanner
 
 
 class ReportWriter:
-    """Writes a scan summary as a formatted Markdown report."""
+    """Writes a completed scan as a formatted Markdown report."""
 
     def __init__(self, output_dir: str) -> None:
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
 
     def write_report(
-        self, summary: Dict[str, Any], filename: str = "scan_report.md"
+        self, scanner: FileScanner, filename: str = "scan_report.md"
     ) -> str:
         """
-        Write the scan summary to a Markdown file.
+        Write the results of a finished scan to a Markdown file.
+
+        Reads the scanner's containers directly, without copying them,
+        so large scans are not duplicated in memory.
 
         Args:
-            summary: Dict returned by FileScanner.get_summary().
+            scanner: FileScanner whose scan() has been fully consumed.
             filename: Output filename (default: scan_report.md).
 
         Returns:
             Absolute path to the generated report file.
+
+        Raises:
+            RuntimeError: If the scanner's counters are inconsistent.
         """
+        scanner._verify_counters()
         report_path = os.path.join(self.output_dir, filename)
 
-        with open(report_path, "w", encoding="utf-8") as f:
+        # Build the whole report in memory and write it with a single call
+        # instead of one f.write() per line.
+        parts: list[str] = []
+        append = parts.append
 
-            f.write("# File System Scan Report\n\n")
+        append("# File System Scan Report\n\n")
 
-            # ── Scan Counters ────────────────────────────────────────
-            f.write("## Scan Counters\n\n")
-            f.write(f"- **Total Discovered**: {summary['total_discovered']}\n")
-            f.write(f"- **Total Processed**:  {summary['total_processed']}\n")
-            f.write(f"- **Total Failed**:     {summary['total_failed']}\n\n")
+        # ── Scan Counters ────────────────────────────────────────────
+        append("## Scan Counters\n\n")
+        append(f"- **Total Discovered**: {scanner.total_discovered}\n")
+        append(f"- **Total Processed**:  {scanner.total_processed}\n")
+        append(f"- **Total Failed**:     {scanner.total_failed}\n\n")
 
-            # ── File Extensions ──────────────────────────────────────
-            f.write("## File Extensions Count\n\n")
-            if summary["extension_count"]:
+        # ── File Extensions ──────────────────────────────────────────
+        append("## File Extensions Count\n\n")
+        if scanner.extension_count:
+            append("".join([
+                f"- **{ext}**: {count}\n"
                 for ext, count in sorted(
-                    summary["extension_count"].items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                ):
-                    f.write(f"- **{ext}**: {count}\n")
-            else:
-                f.write("_None found._\n")
-            f.write("\n")
-
-            # ── Large Files ──────────────────────────────────────────
-            f.write("## Large Files\n\n")
-            if summary["large_files"]:
-                for path in summary["large_files"]:
-                    f.write(f"- `{path}`\n")
-            else:
-                f.write("_None detected._\n")
-            f.write("\n")
-
-            # ── Duplicate File Names ─────────────────────────────────
-            f.write("## Duplicate File Names\n\n")
-            duplicates = {
-                name: paths
-                for name, paths in summary["duplicates"].items()
-                if len(paths) > 1
-            }
-            if duplicates:
-                for name, paths in duplicates.items():
-                    f.write(f"### `{name}`\n")
-                    for p in paths:
-                        f.write(f"- `{p}`\n")
-                    f.write("\n")
-            else:
-                f.write("_No duplicates found._\n")
+                    scanner.extension_count.items(),
+                    # ties broken by name — scan order is not stable
+                    key=lambda x: (-x[1], x[0]),
+                )
+            ]))
+        else:
+            append("_None found._\n")
+        append("\n")
+
+        # ── Large Files ──────────────────────────────────────────────
+        append("## Large Files\n\n")
+        if scanner.large_files:
+            append("".join([f"- `{path}`\n" for path in scanner.large_files]))
+        else:
+            append("_None detected._\n")
+        append("\n")
+
+        # ── Duplicate Files (identical content) ──────────────────────
+        append("## Duplicate Files\n\n")
+        duplicates = "\n".join([
+            f"### `{digest.hex()}`\n" + "".join([f"- `{p}`\n" for p in paths])
+            for digest, paths in scanner.duplicates.items()
+        ])
+        if duplicates:
+            append(duplicates)
+            append("\n")
+        else:
+            append("_No duplicates found._\n")
+
+        # Write straight to a raw fd — skips the TextIOWrapper/BufferedWriter
+        # layers (and their isatty/seek probes) for a single big write.
+        payload = memoryview("".join(parts).encode("utf-8"))
+        fd = os.open(report_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload):]
+        finally:
+            os.close(fd)
 
         return report_path
\ No newline at end of file